@@ -1,14 +1,91 @@
+import ijson
+import logging
 import requests
 
-from io import BufferedReader
-from typing import IO, TYPE_CHECKING, Union, Literal as L
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BufferedReader, StringIO
+from requests.adapters import HTTPAdapter
+from typing import IO, TYPE_CHECKING, Optional, Union, Literal as L
 from tripper import Literal
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from typing import Generator
+    from collections.abc import Iterable, Sequence
+    from typing import Generator, Iterator, Tuple
     from tripper.triplestore import Triple
 
+logger = logging.getLogger(__name__)
+
+# HTTP session shared by the backends, keeping connections alive between requests
+_SESSION = requests.Session()
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(
+        _scheme,
+        HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.2)),
+    )
+
+# Variable names of the subject, predicate and object of a triple
+_TRIPLE_NAMES = ("s", "p", "o")
+
+# First characters of the terms that need no formatting (`<iri>` and `"literal"`)
+_ALREADY_FORMATTED = frozenset(("<", '"'))
+
+
+def _parse_select_results(raw: IO) -> "Tuple[list, Iterator[dict]]":
+    """Parse SPARQL JSON results incrementally
+
+    The bindings are streamed when `head` precedes `results` in the document,
+    otherwise they are buffered until `head` has been read.
+
+    Args:
+        raw (IO): The SPARQL JSON results document
+
+    Raises:
+        ValueError: The document has no `head.vars`
+
+    Returns:
+        Tuple[list, Iterator[dict]]: The projected variables and the bindings
+    """
+
+    events = ijson.parse(raw)
+    first = None
+    for prefix, event, value in events:
+        if prefix == "" and event == "map_key" and value in ("head", "results"):
+            first = value
+            break
+
+    if first == "head":
+        queryVars = next(ijson.items(events, "head.vars"), None)
+        bindings = ijson.items(events, "results.bindings.item")
+    else:
+        buffered = []
+        builder = None
+        for prefix, event, value in events:
+            if prefix == "" and event == "map_key" and value == "head":
+                break
+            if builder is None:
+                if prefix == "results.bindings.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+            else:
+                builder.event(event, value)
+                if prefix == "results.bindings.item" and event == "end_map":
+                    buffered.append(builder.value)
+                    builder = None
+        queryVars = next(ijson.items(events, "head.vars"), None)
+        bindings = iter(buffered)
+
+    if queryVars is None:
+        raise ValueError("Unexpected SPARQL results: missing head.vars")
+
+    return queryVars, bindings
+
 
 class FusekiStrategy:
     __CONTENT_TYPES = {"turtle": "text/turtle", "rdf": "application/rdf+xml"}
@@ -19,6 +96,15 @@ class FusekiStrategy:
         "schema": "http://schema.org/",
     }
 
+    # Size of the chunks written by serialize
+    __CHUNK_SIZE = 65536
+
+    # Maximum number of triples sent in a single INSERT DATA request
+    BATCH_SIZE = 1000
+
+    # Number of triples above which add_triples uses bulk_load
+    BULK_THRESHOLD = 10000
+
     # DEFAULT GRAPH
 
     __graph = "graph://main"
@@ -39,7 +125,9 @@ class FusekiStrategy:
             triplestoreUrl (str): URL of the Triplestore.
             database (str): Database of the Triplestore to be used.
             kwargs (object): Additional keyword arguments passed to the backend.
-                             I.e. `graph` to use a specific graph rather than the default one.
+                             I.e. `graph` to use a specific graph rather than the default one,
+                             `max_workers` to set the number of INSERT DATA batches sent concurrently,
+                             `cache_size` to cache the results of that many SELECT queries (disabled by default).
         """
 
         self.__namespaces = {}
@@ -47,12 +135,19 @@ class FusekiStrategy:
 
         self.__namespaces.update(self.__DEFAULT_NAMESPACES)
         self.__namespaces[""] = base_iri
+        self.__base_open: Optional[str] = f"<{base_iri}" if base_iri else None
+        self.__update_prefixes()
         self.sparql_endpoint = f"{triplestore_url}/{database}"
 
         if "graph" in kwargs:
             FusekiStrategy.__graph = kwargs["graph"]
 
         self.graph = FusekiStrategy.__graph
+        self.max_workers = kwargs.get("max_workers", 4)
+
+        self.__cache_size = kwargs.get("cache_size", 0)
+        self.__result_cache = OrderedDict()
+        self.__writes = 0  # number of writes, to discard results read across a write
 
     def triples(self, triple: "Triple") -> "Generator":
         """Execute query on triples
@@ -64,81 +159,131 @@ class FusekiStrategy:
             Generator: Matching triples
         """
 
-        variables = [
-            f"?{tripleName}"
-            for tripleName, tripleValue in zip("spo", triple)
-            if tripleValue is None
-        ]
+        fmt = self._fmt
+        variables = []
+        whereParts = []
+        for tripleName, tripleValue in zip(_TRIPLE_NAMES, triple):
+            if tripleValue is None:
+                variable = f"?{tripleName}"
+                variables.append(variable)
+                whereParts.append(variable)
+            else:
+                whereParts.append(fmt(tripleValue))
         if not variables:
             variables.append("*")
-        whereSpec = " ".join(
-            (
-                f"?{tripleName}"
-                if tripleValue is None
-                else (
-                    tripleValue
-                    if tripleValue.startswith("<")
-                    else (
-                        "<{}{}>".format(self.__namespaces[""], tripleValue[1:])
-                        if tripleValue.startswith(":")
-                        else f"<{tripleValue}>"
-                    )
-                )
-            )
-            for tripleName, tripleValue in zip("spo", triple)
-        )
+        whereSpec = " ".join(whereParts)
         cmd = f"""
             SELECT {" ".join(variables)}
             FROM <{self.graph}>
             WHERE {{{whereSpec}}}
         """
 
-        res = self._request("GET", cmd)
-
-        for binding in res["results"]["bindings"]:
-            yield tuple(
-                (
-                    self.__convert_json_entrydict(binding[name])
-                    if name in binding
-                    else value
+        cmd = self.format_query(cmd)
+        key = cmd if self.__cache_size else None
+        cached = self.__cache_get(key)
+        if cached is not None:
+            yield from cached
+            return
+
+        writes = self.__writes
+        res = self._request("GET", cmd, prefix=False, stream=True)
+        if not res:
+            return
+
+        convert = self.__convert_json_entrydict
+        rows = [] if key is not None else None
+        with res["response"] as response:
+            response.raw.decode_content = True
+            for binding in ijson.items(response.raw, "results.bindings.item"):
+                row = tuple(
+                    (
+                        convert(binding[name])
+                        if name in binding
+                        else value
+                    )
+                    for name, value in zip(_TRIPLE_NAMES, triple)
                 )
-                for name, value in zip("spo", triple)
-            )
+                if rows is not None:
+                    rows.append(row)
+                yield row
+
+        self.__cache_set(key, rows, writes)
 
-    def add_triples(self, triples: "Sequence[Triple]") -> dict:
+    def add_triples(self, triples: "Iterable[Triple]") -> dict:
         """Add a sequence of triples.
 
+        The triples are sent in chunks of at most `BATCH_SIZE` triples, one
+        INSERT DATA request per chunk. Up to `max_workers` chunks are sent
+        concurrently: the chunks are independent of each other and the
+        triplestore is relied on to serialise the writes, so they may be
+        applied in any order.
+
+        More than `BULK_THRESHOLD` triples are instead serialised as Turtle and
+        sent at once through `bulk_load`, skipping the SPARQL update parsing.
+
         Args:
-            triples (Sequence[Triple]): A sequence of `(s, p, o)` tuples to add to the triplestore.
+            triples (Iterable[Triple]): An iterable of `(s, p, o)` tuples to add to the triplestore.
 
         Returns:
-            dict: The result of the operation
+            dict: The aggregated result of the operations
         """
 
-        spec = " ".join(
-            " ".join(
-                (
-                    value.n3()
-                    if isinstance(value, Literal) and hasattr(value, "n3")
-                    else (
-                        value
-                        if value.startswith("<") or value.startswith('"')
-                        else (
-                            "<{}{}>".format(self.__namespaces[""], value[1:])
-                            if "" in self.__namespaces and value.startswith(":")
-                            else str(value) if value.startswith(":") else f"<{value}>"
-                        )
-                    )
-                )
-                for value in triple
+        if not hasattr(triples, "__len__"):
+            triples = list(triples)
+        bulk = len(triples) > self.BULK_THRESHOLD
+
+        fmt = self._fmt
+        specs = []
+        buf = StringIO()
+        write = buf.write
+        if bulk:
+            # The PREFIX declarations are valid Turtle as well
+            write(self.__prefix_block)
+            write("\n")
+
+        count = 0
+        for triple in triples:
+            for value in triple:
+                write(fmt(value))
+                write(" ")
+            write(".\n")
+            count += 1
+            if count == self.BATCH_SIZE and not bulk:
+                specs.append(buf.getvalue())
+                buf.seek(0)
+                buf.truncate()
+                count = 0
+        if count:
+            specs.append(buf.getvalue())
+
+        if bulk:
+            data = buf.getvalue().encode("utf-8")
+            return self.bulk_load(data, content_type="text/turtle")
+
+        cmds = [
+            f"INSERT DATA {{ GRAPH <{self.graph}> {{ {spec} }} }}" for spec in specs
+        ]
+
+        def insert(cmd: str) -> dict:
+            headers = {"Content-Type": "application/sparql-update"}
+            return self._request(
+                "POST", cmd, headers=headers, plainData=True, graph=True
             )
-            + " ."
-            for triple in triples
-        )
 
-        cmd = f"INSERT DATA {{ GRAPH <{self.graph}> {{ {spec} }} }}"
-        headers = {"Content-Type": "application/sparql-update"}
-        return self._request("POST", cmd, headers=headers, plainData=True, graph=True)
+        if len(cmds) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(cmds))
+            ) as executor:
+                results = list(executor.map(insert, cmds))
+        else:
+            results = [insert(cmd) for cmd in cmds]
+
+        res = {}
+        for result in results:
+            res.update(result)
+
+        self.__invalidate_cache()
+        return res
 
     def remove(self, triple: "Triple") -> object:
         """Remove all matching triples from the backend.
@@ -150,32 +295,74 @@ class FusekiStrategy:
             dict: The result of the operation
         """
 
-        spec = " ".join(
-            (
-                f"?{name}"
-                if value is None
-                else (
-                    value.n3()
-                    if isinstance(value, Literal)
-                    else (
-                        value
-                        if value.startswith("<") or value.startswith('"')
-                        else (
-                            "<{}{}>".format(self.__namespaces[""], value[1:])
-                            if value.startswith(":")
-                            else f"<{value}>"
-                        )
-                    )
-                )
-            )
-            for name, value in zip("spo", triple)
-        )
+        spec = self._format_triple(triple, with_vars=True)
         cmd = f"DELETE WHERE {{ GRAPH <{self.graph}> {{ { spec } }} }}"
 
-        return self._request("POST", cmd)
+        res = self._request("POST", cmd)
+        self.__invalidate_cache()
+        return res
 
     # ADDITIONAL METHODS
 
+    def replace_triples(
+        self, deletes: "Sequence[Triple]" = (), inserts: "Sequence[Triple]" = ()
+    ) -> dict:
+        """Delete and insert triples within a single SPARQL update request.
+
+        The DELETE DATA operation is sent before the INSERT DATA one, so a triple
+        appearing in both `deletes` and `inserts` ends up in the triplestore.
+
+        Args:
+            deletes (Sequence[Triple]): A sequence of `(s, p, o)` tuples to remove from the triplestore.
+            inserts (Sequence[Triple]): A sequence of `(s, p, o)` tuples to add to the triplestore.
+
+        Returns:
+            dict: The result of the operation
+        """
+
+        format_triple = self._format_triple
+        operations = []
+        if deletes:
+            del_spec = " ".join(format_triple(triple) + " ." for triple in deletes)
+            operations.append(
+                f"DELETE DATA {{ GRAPH <{self.graph}> {{ {del_spec} }} }}"
+            )
+        if inserts:
+            ins_spec = " ".join(format_triple(triple) + " ." for triple in inserts)
+            operations.append(
+                f"INSERT DATA {{ GRAPH <{self.graph}> {{ {ins_spec} }} }}"
+            )
+
+        if not operations:
+            return {}
+
+        cmd = " ; ".join(operations)
+        headers = {"Content-Type": "application/sparql-update"}
+        res = self._request("POST", cmd, headers=headers, plainData=True, graph=True)
+        self.__invalidate_cache()
+        return res
+
+    def bulk_load(
+        self, data: bytes, content_type: str = "application/n-triples"
+    ) -> dict:
+        """Add serialised triples to the graph through the Graph Store Protocol.
+
+        The data is posted as is to the graph, without being wrapped in a
+        SPARQL update.
+
+        Args:
+            data (bytes): The serialised triples.
+            content_type (str, optional): Media type of `data`. Defaults to "application/n-triples".
+
+        Returns:
+            dict: The result of the operation
+        """
+
+        headers = {"Content-Type": content_type}
+        res = self._request("POST", data, headers=headers, plainData=True, graph=True)
+        self.__invalidate_cache()
+        return res
+
     def parse(
         self,
         source: Union[str, IO] = "",
@@ -207,7 +394,7 @@ class FusekiStrategy:
             else:
                 content = source.read()
         elif location:
-            resp = requests.get(location)
+            resp = _SESSION.get(location)
             resp.raise_for_status()
             content = resp.content
         elif data:
@@ -219,12 +406,15 @@ class FusekiStrategy:
 
         headers = {"Content-type": f"{self.__CONTENT_TYPES[format]}"}
         self._request("POST", cmd=content, headers=headers, plainData=True, graph=True)
+        self.__invalidate_cache()
 
     def serialize(
         self, destination: Union[str, IO] = "", format: str = "turtle", **kwargs
     ) -> str:
         """Serialise to destination.
 
+        When `destination` is defined, the serialisation is streamed to it in chunks.
+
         Arguments:
             destination: File name or object to write to. If not defined, the serialisation is returned.
             format: Format to serialise as. Supported formats, depends on the backend.
@@ -234,15 +424,27 @@ class FusekiStrategy:
             Serialised string if `destination` is not defined.
         """
 
-        content = self._request("GET", prefix=False, graph=True, json=False)["response"]
-
-        if not destination:
-            return content
-        elif isinstance(destination, str):
-            with open(destination, "w") as f:
-                f.write(content)
-        else:
-            destination.write(content)
+        res = self._request("GET", prefix=False, graph=True, stream=True)
+        if not res:
+            return ""
+
+        with res["response"] as response:
+            # RDF serialisations are UTF-8 unless a charset is stated, whereas
+            # requests falls back to ISO-8859-1 for any text/* response
+            if "charset=" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = "utf-8"
+            chunks = response.iter_content(
+                chunk_size=self.__CHUNK_SIZE, decode_unicode=True
+            )
+            if not destination:
+                return "".join(chunks)
+            elif isinstance(destination, str):
+                with open(destination, "w", encoding="utf-8") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+            else:
+                for chunk in chunks:
+                    destination.write(chunk)
 
         return ""
 
@@ -260,20 +462,27 @@ class FusekiStrategy:
         iw = query_object.index("WHERE")
         queryStr = f"{query_object[:iw]}FROM <{self.graph}> {query_object[iw:]}".strip()
 
-        res = self._request("GET", queryStr)
+        queryStr = self.format_query(queryStr)
+        key = queryStr if self.__cache_size else None
+        cached = self.__cache_get(key)
+        if cached is not None:
+            return list(cached)
 
-        queryVars = res["head"]["vars"]
-        queryBindings = res["results"]["bindings"]
+        writes = self.__writes
+        res = self._request("GET", queryStr, prefix=False, stream=True)
+        if not res:
+            return []
 
+        convert = self.__convert_json_entrydict
         triplesRes = []
-        for binding in queryBindings:
-            currentTriple = ()
-            for var in queryVars:
-                currentTriple = currentTriple + (
-                    self.__convert_json_entrydict(binding[var]),
-                )
-            triplesRes.append(currentTriple)
+        with res["response"] as response:
+            response.raw.decode_content = True
+            queryVars, bindings = _parse_select_results(response.raw)
 
+            for binding in bindings:
+                triplesRes.append(tuple(convert(binding[var]) for var in queryVars))
+
+        self.__cache_set(key, list(triplesRes), writes)
         return triplesRes
 
     def bind(self, prefix: str, namespace: Union[str, None]):
@@ -290,6 +499,11 @@ class FusekiStrategy:
             if prefix in self.__namespaces:
                 del self.__namespaces[prefix]
 
+        if prefix == "":
+            self.__base_open = f"<{namespace}" if namespace else None
+
+        self.__update_prefixes()
+
     def namespaces(self) -> dict:
         """Get the SPARQL namespaces
 
@@ -299,6 +513,21 @@ class FusekiStrategy:
 
         return self.__namespaces
 
+    def format_query(self, query: str) -> str:
+        """Prepend the PREFIX declarations of the SPARQL namespaces to a query
+
+        The PREFIX block is prebuilt when the namespaces are set and rebuilt
+        only when they are changed through `bind`.
+
+        Args:
+            query (str): SPARQL query or update to be prefixed
+
+        Returns:
+            str: The query preceded by the PREFIX declarations
+        """
+
+        return self.__prefix_block + query
+
     @classmethod
     def create_database(cls, database: str, **kwargs):
         """Create a new database in backend.
@@ -320,7 +549,7 @@ class FusekiStrategy:
             kwargs: Keyword arguments passed to the backend remove_database() method.
         """
 
-        requests.delete(f"{triplestore_url}/{database}?graph={cls.__graph}")
+        _SESSION.delete(f"{triplestore_url}/{database}?graph={cls.__graph}")
 
     @classmethod
     def list_databases(cls, **kwargs) -> str:
@@ -344,6 +573,7 @@ class FusekiStrategy:
         plainData: bool = False,
         graph: bool = False,
         json: bool = True,
+        stream: bool = False,
     ) -> dict:
         """Generic REST method caller for the Triplestore
 
@@ -355,13 +585,14 @@ class FusekiStrategy:
             plainData (bool, optional): If data needs a format or is plain. Defaults to False.
             graph (bool, optional): If the endpoint needs to specify the graph. Defaults to False.
             json (bool, optional): If the result is a JSON or a dict containing the result as string. Defaults to True.
+            stream (bool, optional): If the result is a dict containing the open response to be consumed incrementally. Defaults to False.
 
         Returns:
-            dict: Dict containing the result as JSON or text
+            dict: Dict containing the result as JSON, text or streamed response
         """
 
         if method not in ["GET", "POST"]:
-            print("Method unknown")
+            logger.error("Method unknown: %s", method)
             return {}
 
         ep = (
@@ -371,16 +602,10 @@ class FusekiStrategy:
         )
 
         if prefix and isinstance(cmd, str):
-            cmd = (
-                " ".join(
-                    f"PREFIX {k}: <{v}>" for k, v in self.namespaces().items() if v
-                )
-                + " "
-                + cmd
-            )
+            cmd = self.format_query(cmd)
 
         try:
-            r: requests.Response = requests.request(
+            r: requests.Response = _SESSION.request(
                 method=method,
                 url=ep,
                 headers=headers,
@@ -390,15 +615,70 @@ class FusekiStrategy:
                     if method == "POST" and plainData
                     else {"update": cmd} if method == "POST" and not plainData else None
                 ),
+                stream=stream,
             )
-            r.raise_for_status()
-            if r.status_code == 200:
-                return r.json() if json else {"response": r.text}
-            return {}
         except requests.RequestException as e:
-            print(e)
+            logger.error(e)
+            return {}
+
+        if r.status_code >= 400:
+            logger.error("Request failed with %s: %s", r.status_code, r.text)
+            return {}
+        if r.status_code != 200:
+            r.close()
             return {}
 
+        if stream:
+            return {"response": r}
+        if not json:
+            return {"response": r.text}
+
+        try:
+            return _loads(r.content)
+        except ValueError:
+            logger.debug("Response is not JSON: %s", r.headers.get("Content-Type"))
+            return {}
+
+    def _format_triple(self, triple: "Triple", with_vars: bool = False) -> str:
+        """Format a triple as a SPARQL triple pattern
+
+        Args:
+            triple (Triple): A `(s, p, o)` tuple to be formatted.
+            with_vars (bool, optional): If `None` values need to be formatted as the `?s`, `?p` and `?o` variables. Defaults to False.
+
+        Returns:
+            str: The triple formatted as a space-separated string
+        """
+
+        fmt = self._fmt
+        return " ".join(
+            f"?{name}" if with_vars and value is None else fmt(value)
+            for name, value in zip(_TRIPLE_NAMES, triple)
+        )
+
+    def _fmt(self, value: str) -> str:
+        """Format an RDF term as it has to appear in a SPARQL command
+
+        Args:
+            value (str): IRI, prefixed name or literal to be formatted
+
+        Returns:
+            str: The formatted term
+        """
+
+        if isinstance(value, Literal) and hasattr(value, "n3"):
+            return value.n3()
+
+        first = value[:1]
+        if first in _ALREADY_FORMATTED:
+            return value
+        if first == ":":
+            base_open = self.__base_open
+            if base_open is not None:
+                return base_open + value[1:] + ">"
+            return str(value)
+        return f"<{value}>"
+
     # PRIVATE METHODS
 
     def __convert_json_entrydict(self, entrydict: dict) -> str:
@@ -414,24 +694,88 @@ class FusekiStrategy:
             str: The entry dict correctly formatted as a string
         """
 
-        if entrydict["type"] == "uri":
-            if entrydict["value"].startswith(":"):
-                return "<{}{}>".format(self.__namespaces[""], entrydict["value"][1:])
-            else:
-                return entrydict["value"]
+        converter = self.__CONVERTERS.get(entrydict["type"])
+        if converter is None:
+            raise ValueError(f"Unexpected type in entrydict: {entrydict}")
 
-        if entrydict["type"] == "literal":
-            return Literal(
-                entrydict["value"],
-                lang=entrydict.get("xml:lang"),
-                datatype=entrydict.get("datatype"),
-            )
+        return converter(self, entrydict)
 
-        if entrydict["type"] == "bnode":
-            return (
-                entrydict["value"]
-                if entrydict["value"].startswith("_:")
-                else f"_:{entrydict['value']}"
-            )
+    def __convert_uri(self, entrydict: dict) -> str:
+        """Convert a JSON entry dict of type `uri`"""
+
+        value = entrydict["value"]
+        base_open = self.__base_open
+        if base_open is not None and value[:1] == ":":
+            return base_open + value[1:] + ">"
+        return value
+
+    def __convert_literal(self, entrydict: dict) -> Literal:
+        """Convert a JSON entry dict of type `literal`"""
+
+        return Literal(
+            entrydict["value"],
+            lang=entrydict.get("xml:lang"),
+            datatype=entrydict.get("datatype"),
+        )
+
+    def __convert_bnode(self, entrydict: dict) -> str:
+        """Convert a JSON entry dict of type `bnode`"""
+
+        value = entrydict["value"]
+        return value if value.startswith("_:") else f"_:{value}"
+
+    def __update_prefixes(self):
+        """Render the PREFIX declarations of the current SPARQL namespaces"""
+
+        self.__prefix_block = "".join(
+            "PREFIX {}: <{}> ".format(k, v) for k, v in self.__namespaces.items() if v
+        )
+
+    def __invalidate_cache(self):
+        """Clear the cached SELECT results after a write"""
+
+        self.__writes += 1
+        self.__result_cache.clear()
 
-        raise ValueError(f"Unexpected type in entrydict: {entrydict}")
+    def __cache_get(self, key: Optional[str]) -> Optional[list]:
+        """Get the cached result of a SELECT query
+
+        Args:
+            key (Optional[str]): The prefixed query, None if caching is disabled
+
+        Returns:
+            Optional[list]: The cached result, None if not cached
+        """
+
+        if key is None or key not in self.__result_cache:
+            return None
+
+        self.__result_cache.move_to_end(key)
+        return self.__result_cache[key]
+
+    def __cache_set(self, key: Optional[str], result: Optional[list], writes: int):
+        """Cache the result of a SELECT query, evicting the least recently used one
+
+        The result is discarded if a write happened since the query was sent,
+        e.g. while the caller was iterating over `triples`.
+
+        Args:
+            key (Optional[str]): The prefixed query, None if caching is disabled
+            result (Optional[list]): The result of the query
+            writes (int): The number of writes when the query was sent
+        """
+
+        if key is None or result is None or writes != self.__writes:
+            return
+
+        self.__result_cache[key] = result
+        self.__result_cache.move_to_end(key)
+        if len(self.__result_cache) > self.__cache_size:
+            self.__result_cache.popitem(last=False)
+
+    # JSON entry dict converters, indexed by the type of the entry
+    __CONVERTERS = {
+        "uri": __convert_uri,
+        "literal": __convert_literal,
+        "bnode": __convert_bnode,
+    }
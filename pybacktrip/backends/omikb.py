@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 import requests
 import yaml
@@ -6,7 +7,9 @@ import yaml
 from io import BufferedReader
 from typing import Literal, Union
 
-from .fuseki import FusekiStrategy
+from .fuseki import _SESSION, _loads, FusekiStrategy
+
+logger = logging.getLogger(__name__)
 
 
 class OmikbStrategy(FusekiStrategy):
@@ -34,15 +37,13 @@ class OmikbStrategy(FusekiStrategy):
             "POST": config["services"]["kb"]["end_point"]["base"],
         }
 
-        print(f"token= {self.hub_token}")
-
         self.username = config["jupyter"]["username"]
-        print(f"hub user name is {self.username}")
+        logger.debug("hub user name is %s", self.username)
         self.hub_api_header = {
             "Authorization": f"token {self.hub_token}",
         }
 
-        response = requests.get(
+        response = _SESSION.get(
             f"{self.hub_iri}/hub/api/users/{self.username}", headers=self.hub_api_header
         )
         if response.status_code != 200:
@@ -51,20 +52,21 @@ class OmikbStrategy(FusekiStrategy):
                       \nSorry, you are not able to use OMI - Contact Admin"
             )
 
-        user_data = response.json()
+        user_data = _loads(response.content)
         auth_state = user_data.get("auth_state", {})
         self.access_token = auth_state.get("access_token", {})
-        print(
-            f"Hello {self.username}: Your access token is obtained: (Showing last 10 digits only) "
-            f"{self.access_token[-10:]}"
+        logger.debug(
+            "Hello %s: Your access token is obtained: (Showing last 10 digits only) %s",
+            self.username,
+            self.access_token[-10:],
         )
 
         self.userinfo = user_data["auth_state"]["oauth_user"]
 
-        print(
-            "Initialised Knowledge Base and OMI access from the jupyter interface for the user:"
+        logger.info(
+            "Initialised Knowledge Base and OMI access from the jupyter interface for the user:\n%s",
+            json.dumps(self.userinfo, indent=2),
         )
-        print(print(json.dumps(self.userinfo, indent=2)))
 
     def _request(
         self,
@@ -75,6 +77,7 @@ class OmikbStrategy(FusekiStrategy):
         plainData: bool = False,
         graph: bool = False,
         json: bool = True,
+        stream: bool = False,
     ) -> dict:
         """Generic REST method caller for the Triplestore
 
@@ -86,13 +89,14 @@ class OmikbStrategy(FusekiStrategy):
             plainData (bool, optional): If data needs a format or is plain. Defaults to False.
             graph (bool, optional): If the endpoint needs to specify the graph. Defaults to False.
             json (bool, optional): If the result is a JSON or a dict containing the result as string. Defaults to True.
+            stream (bool, optional): If the result is a dict containing the open response to be consumed incrementally. Defaults to False.
 
         Returns:
-            dict: Dict containing the result as JSON or text
+            dict: Dict containing the result as JSON, text or streamed response
         """
 
         if method not in ["GET", "POST"]:
-            print("Method unknown")
+            logger.error("Method unknown: %s", method)
             return {}
 
         ep = (
@@ -102,19 +106,13 @@ class OmikbStrategy(FusekiStrategy):
         )
 
         if prefix and isinstance(cmd, str):
-            cmd = (
-                " ".join(
-                    f"PREFIX {k}: <{v}>" for k, v in self.namespaces().items() if v
-                )
-                + " "
-                + cmd
-            )
+            cmd = self.format_query(cmd)
 
         headers["Authorization"] = f"Bearer {self.access_token}"
         headers["Accept"] = "application/json"
 
         try:
-            r: requests.Response = requests.request(
+            r: requests.Response = _SESSION.request(
                 method="POST",
                 url=ep,
                 headers=headers,
@@ -124,11 +122,26 @@ class OmikbStrategy(FusekiStrategy):
                     if method == "POST" and plainData
                     else {"update": cmd} if method == "POST" and not plainData else None
                 ),
+                stream=stream,
             )
-            r.raise_for_status()
-            if r.status_code == 200:
-                return r.json() if json else {"response": r.text}
-            return {}
         except requests.RequestException as e:
-            print(e)
+            logger.error(e)
+            return {}
+
+        if r.status_code >= 400:
+            logger.error("Request failed with %s: %s", r.status_code, r.text)
+            return {}
+        if r.status_code != 200:
+            r.close()
+            return {}
+
+        if stream:
+            return {"response": r}
+        if not json:
+            return {"response": r.text}
+
+        try:
+            return _loads(r.content)
+        except ValueError:
+            logger.debug("Response is not JSON: %s", r.headers.get("Content-Type"))
             return {}
@@ -1,4 +1,5 @@
 import io
+import logging
 import os
 from typing import TYPE_CHECKING
 
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
     from SPARQLWrapper import QueryResult
     from tripper.triplestore import Triple
 
+logger = logging.getLogger(__name__)
+
 
 class StardogStrategy:
     ## Class attributes
@@ -70,10 +73,10 @@ class StardogStrategy:
                 self.__database_name, **self.__connection_details
             )
         except Exception as err:
-            print(
-                "Unable to connect to Stardog instance: {}".format(
-                    self.__connection_details
-                )
+            logger.error(
+                "Unable to connect to Stardog instance %s: %s",
+                self.__connection_details["endpoint"],
+                err,
             )
 
     @classmethod
@@ -89,7 +92,7 @@ class StardogStrategy:
         try:
             databases = list(map(lambda x: x.name, __admin.databases()))
         except Exception as err:
-            print("Exception occurred during databases listing: {}".format(err))
+            logger.error("Exception occurred during databases listing: %s", err)
 
         return databases
 
@@ -106,7 +109,7 @@ class StardogStrategy:
         if not database in databases:
             db = __admin.new_database(database)
         else:
-            print("Database {} already exists".format(database))
+            logger.warning("Database %s already exists", database)
 
     @classmethod
     def remove_database(cls, triplestore_url: str, database: str, **kwargs):
@@ -119,7 +122,7 @@ class StardogStrategy:
 
         databases = list(map(lambda x: x.name, __admin.databases()))
         if not database in databases:
-            print("Database {} does not exists".format(database))
+            logger.warning("Database %s does not exists", database)
         else:
             __admin.database(database).drop()
 
@@ -234,12 +237,9 @@ class StardogStrategy:
 
         triples_res = []
         for binding in query_bindings:
-            current_triple = ()
-            for var in query_vars:
-                current_triple = current_triple + (
-                    self.__convert_json_entrydict(binding[var]),
-                )
-            triples_res.append(current_triple)
+            triples_res.append(
+                tuple(self.__convert_json_entrydict(binding[var]) for var in query_vars)
+            )
 
         return triples_res
 
@@ -257,11 +257,11 @@ class StardogStrategy:
             else:
                 self.__database.add_namespace(prefix, namespace)
         except Exception as err:
-            print(err)
+            logger.error(err)
 
     def serialize(self, destination=None, format="turtle", **kwargs):
         if format not in self.__serialization_format_supported:
-            print("Format {} not supported".format(format))
+            logger.error("Format %s not supported", format)
             return None
 
         stardog_content_type = stardog.content_types.TURTLE
@@ -317,7 +317,7 @@ class StardogStrategy:
 
     ## Private methods
     def __set_sparql_endpoint(self, type: str = "query"):
-        print("Swapping active sparql endpoint to {}".format(type))
+        logger.debug("Swapping active sparql endpoint to %s", type)
 
         self.sparql = self.__sparql_endpoints[type]
 
@@ -1,7 +1,11 @@
+import io
 import os
+import tempfile
 import unittest
+from unittest import mock
 
 import requests
+from pybacktrip.backends import fuseki
 from pybacktrip.backends.fuseki import FusekiStrategy
 from rdflib import BNode, URIRef
 from tripper import RDF, Literal
@@ -143,6 +147,50 @@ class Fuseki_TestCase(unittest.TestCase):
 
         self.assertEqual(len(triples), 1)
 
+    def test_add_triples_batches(self):
+        to_add = [
+            (
+                f"<http://onto-ns.com/ontologies/examples/food#FOOD_{i}>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+            for i in range(FusekiStrategy.BATCH_SIZE + 1)
+        ]
+
+        self.triplestore.add_triples(to_add)
+
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), len(to_add))
+        self.assertCountEqual(triples, to_add)
+
+    def test_add_triples_generator(self):
+        to_add = [
+            (
+                f"<http://onto-ns.com/ontologies/examples/food#FOOD_{i}>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+            for i in range(3)
+        ]
+
+        self.triplestore.add_triples(triple for triple in to_add)
+
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), len(to_add))
+        self.assertCountEqual(triples, to_add)
+
+    def test_add_triples_empty(self):
+        self.assertEqual(self.triplestore.add_triples([]), {})
+
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), 0)
+
     def test_remove(self):
         triple_1 = [
             (
@@ -185,6 +233,80 @@ class Fuseki_TestCase(unittest.TestCase):
 
     ## ADDITIONAL METHODS
 
+    def test_replace_triples(self):
+        triple_1 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+        ]
+        triple_2 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/2000/01/rdf-schema#subClassOf>",
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_d2741ae5_f200_4873_8f72_ac315917c41b>",
+            )
+        ]
+        triple_3 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/2004/02/skos/core#prefLabel>",
+                '"Carrot"@en',
+            )
+        ]
+
+        self.triplestore.add_triples(triple_1 + triple_2)
+
+        self.triplestore.replace_triples(deletes=triple_2, inserts=triple_3)
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), 2)
+        self.assertCountEqual(triples, triple_1 + triple_3)
+
+    def test_bulk_load(self):
+        triple_1 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+        ]
+        triple_2 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/2004/02/skos/core#prefLabel>",
+                '"Carrot"@en',
+            )
+        ]
+        data = "".join(" ".join(triple) + " .\n" for triple in triple_1 + triple_2)
+
+        self.triplestore.bulk_load(data.encode())
+
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), 2)
+        self.assertCountEqual(triples, triple_1 + triple_2)
+
+    def test_add_triples_bulk(self):
+        to_add = [
+            (
+                f"<http://onto-ns.com/ontologies/examples/food#FOOD_{i}>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+            for i in range(FusekiStrategy.BULK_THRESHOLD + 1)
+        ]
+
+        self.triplestore.add_triples(to_add)
+
+        query_result = self._selectAll()
+        triples = self._parseQueryResult(query_result)
+
+        self.assertEqual(len(triples), len(to_add))
+
     def test_parse(self):
         ontology_file_path_ttl = os.path.abspath("tests/ontologies/food.ttl")
         ontology_file_path_rdf = os.path.abspath("tests/ontologies/food.rdf")
@@ -237,6 +359,27 @@ class Fuseki_TestCase(unittest.TestCase):
 
         self.assertEqual(expected_serialization, db_content)
 
+    def test_serialize_destination(self):
+        ontology_file_path = os.path.abspath("tests/ontologies/food.ttl")
+
+        self.triplestore.parse(ontology_file_path)
+
+        with open(
+            os.path.abspath("tests/ontologies/fuseki_expected_ontology.ttl"),
+            "r",
+        ) as out_file:
+            expected_serialization = out_file.read()
+
+        destination = io.StringIO()
+        self.triplestore.serialize(destination)
+        self.assertEqual(expected_serialization, destination.getvalue())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination_path = os.path.join(tmpdir, "serialization.ttl")
+            self.triplestore.serialize(destination_path)
+            with open(destination_path, "r", encoding="utf-8") as serialized_file:
+                self.assertEqual(expected_serialization, serialized_file.read())
+
     def test_query(self):
         triple_1 = [
             (
@@ -279,6 +422,110 @@ class Fuseki_TestCase(unittest.TestCase):
             converted_triples_set_2, [(triple_1[0][0], triple_1[0][2])]
         )
 
+    def test_query_cache(self):
+        triplestore = FusekiStrategy(
+            base_iri="http://example.com/ontology#",
+            triplestore_url=f"http://{TRIPLESTORE_HOST}:{TRIPLESTORE_PORT}",
+            database=DATABASE,
+            cache_size=2,
+        )
+        triple_1 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+        ]
+        triple_2 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/2000/01/rdf-schema#subClassOf>",
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_d2741ae5_f200_4873_8f72_ac315917c41b>",
+            )
+        ]
+        query_all = "SELECT ?s ?p ?o WHERE { ?s ?p ?o . }"
+        query_type = "SELECT ?s ?o WHERE { ?s rdf:type ?o . }"
+        query_subclass = "SELECT ?s ?o WHERE { ?s rdfs:subClassOf ?o . }"
+
+        triplestore.add_triples(triple_1)
+
+        with mock.patch.object(
+            fuseki._SESSION, "request", wraps=fuseki._SESSION.request
+        ) as request:
+            ## A repeated query is served from the cache
+            matching_triples_1 = triplestore.query(query_all)
+            matching_triples_2 = triplestore.query(query_all)
+
+            self.assertEqual(request.call_count, 1)
+            self.assertCountEqual(self._normalizeTriples(matching_triples_1), triple_1)
+            self.assertCountEqual(self._normalizeTriples(matching_triples_2), triple_1)
+
+            ## A repeated triples() lookup is served from the cache
+            request.reset_mock()
+            triples_set_1 = list(triplestore.triples((None, None, None)))
+            triples_set_2 = list(triplestore.triples((None, None, None)))
+
+            self.assertEqual(request.call_count, 1)
+            self.assertCountEqual(self._normalizeTriples(triples_set_1), triple_1)
+            self.assertCountEqual(self._normalizeTriples(triples_set_2), triple_1)
+
+            ## A write invalidates the cache
+            triplestore.add_triples(triple_2)
+            request.reset_mock()
+            matching_triples_3 = triplestore.query(query_all)
+            triples_set_3 = list(triplestore.triples((None, None, None)))
+
+            self.assertEqual(request.call_count, 2)
+            self.assertCountEqual(
+                self._normalizeTriples(matching_triples_3), triple_1 + triple_2
+            )
+            self.assertCountEqual(
+                self._normalizeTriples(triples_set_3), triple_1 + triple_2
+            )
+
+            ## The least recently used result is evicted beyond cache_size
+            request.reset_mock()
+            triplestore.query(query_type)
+            triplestore.query(query_subclass)
+            self.assertEqual(request.call_count, 2)
+
+            request.reset_mock()
+            triplestore.query(query_subclass)
+            triplestore.query(query_type)
+            self.assertEqual(request.call_count, 0)
+
+            triplestore.query(query_all)
+            self.assertEqual(request.call_count, 1)
+
+    def test_triples_cache_write_during_iteration(self):
+        triplestore = FusekiStrategy(
+            base_iri="http://example.com/ontology#",
+            triplestore_url=f"http://{TRIPLESTORE_HOST}:{TRIPLESTORE_PORT}",
+            database=DATABASE,
+            cache_size=2,
+        )
+        triple_1 = [
+            (
+                "<http://onto-ns.com/ontologies/examples/food#FOOD_e9cb271c_3be0_44e4_960f_6f6676445dbb>",
+                "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+                "<http://www.w3.org/2002/07/owl#Class>",
+            )
+        ]
+
+        triplestore.add_triples(triple_1)
+
+        ## The rows read before a write in the middle of the iteration are not cached
+        for _ in triplestore.triples((None, None, None)):
+            triplestore.remove(triple_1[0])
+
+        with mock.patch.object(
+            fuseki._SESSION, "request", wraps=fuseki._SESSION.request
+        ) as request:
+            triples = list(triplestore.triples((None, None, None)))
+
+            self.assertEqual(request.call_count, 1)
+            self.assertEqual(len(triples), 0)
+
     def test_bind(self):
         self.triplestore.bind("food", "http://onto-ns.com/ontologies/examples/food#")
         current_namespaces = self.triplestore.namespaces()